@@ -10,12 +10,33 @@ Simple CLI calculator demonstrating:
 - Functions and modular code
 """
 
+import atexit
 import json
 import math
+import sys
+from collections import deque
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
-HISTORY_PATH = Path("calc_history.json")
+try:
+    import orjson  # much faster JSON encode/decode, optional
+except ImportError:
+    orjson = None
+
+HISTORY_PATH = Path("calc_history.jsonl")
+HISTORY_DISPLAY_LIMIT = 100  # how many recent entries 'h' shows
+
+
+def _dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _loads(s):
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
 
 
 # ----- Arithmetic functions -----
@@ -42,64 +63,122 @@ def modulus(a: float, b: float) -> float:
     return a % b
 
 
+# Operator symbol -> function, so main() can dispatch with a dict lookup
+# instead of an if/elif ladder.
+_OPS = {
+    "+": add,
+    "-": subtract,
+    "*": multiply,
+    "/": divide,
+    "^": power,
+    "%": modulus,
+}
+
+
 # ----- History (file handling) -----
-def load_history() -> list:
-    """Load calculation history from HISTORY_PATH. Return list of dicts."""
+def tail_history(limit: int = HISTORY_DISPLAY_LIMIT) -> list:
+    """Return up to the last `limit` history entries from HISTORY_PATH.
+
+    The JSONL log is streamed line by line through a bounded deque, so
+    memory stays O(limit) no matter how large the log has grown, and only
+    the kept lines are parsed.
+    """
     if not HISTORY_PATH.exists():
         return []
+    lines = deque(maxlen=limit)
     try:
         with open(HISTORY_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            if isinstance(data, list):
-                return data
-    except (json.JSONDecodeError, IOError):
-        # If file is corrupted or unreadable, return empty history
+            for line in f:
+                line = line.strip()
+                if line:
+                    lines.append(line)
+    except IOError:
         return []
-    return []
+    history = []
+    for line in lines:
+        try:
+            history.append(_loads(line))
+        except ValueError:
+            # Skip corrupted lines instead of losing the whole history
+            continue
+    return history
 
 
-def save_history(history: list) -> None:
-    """Save history list to HISTORY_PATH as JSON."""
-    try:
-        with open(HISTORY_PATH, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
-    except IOError as e:
-        print(f"Warning: Could not save history: {e}")
+def open_history_log():
+    """Open HISTORY_PATH for appending and keep the handle for the session.
+
+    Using a buffered append-only handle means each calculation costs a single
+    small write instead of re-serializing and rewriting the whole history.
+    The buffer is flushed on interpreter exit.
+    """
+    fh = open(HISTORY_PATH, "a", buffering=64 * 1024, encoding="utf-8")
+    atexit.register(fh.flush)
+    return fh
+
+
+def clear_history_log(log_fh) -> None:
+    """Discard all entries in the on-disk history log."""
+    log_fh.flush()
+    log_fh.truncate(0)
 
 
-def log_calculation(history: list, expr: str, result) -> None:
-    """Append a new entry to history (in-memory) and persist to disk."""
+def log_calculation(log_fh, expr: str, result) -> None:
+    """Append a new entry to the on-disk log.
+
+    Appending never needs the old entries; the 'h' view reads them back
+    from disk on demand.
+    """
     entry = {
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        # Second precision is plenty for a CLI log; skips formatting
+        # microseconds and the extra "Z" concatenation.
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "expression": expr,
         "result": result
     }
-    history.append(entry)
-    save_history(history)
+    try:
+        log_fh.write(_dumps(entry) + "\n")
+    except IOError as e:
+        print(f"Warning: Could not save history: {e}")
 
 
 # ----- Input helpers -----
+def _fast_float(s: str) -> float:
+    """Parse a number, short-circuiting the common plain-integer case.
+
+    Integer strings skip float()'s fraction/exponent machinery; anything
+    else falls through to the general parser.
+    """
+    if s.lstrip("-").isdigit() and len(s) <= 15:
+        return float(int(s))
+    return float(s)
+
+
 def get_number(prompt: str) -> float:
     """Prompt user repeatedly until a valid float is entered."""
     while True:
         s = input(prompt).strip()
         try:
-            return float(s)
+            return _fast_float(s)
         except ValueError:
             print("Invalid number. Please enter a numeric value.")
 
 
+# Built once; the menu never changes, so each prompt is a single print.
+_MENU = """
+Choose operation:
+  +   Addition
+  -   Subtraction
+  *   Multiplication
+  /   Division
+  ^   Power (a^b)
+  %   Modulus (a % b)
+  h   Show history
+  c   Clear history
+  q   Quit"""
+
+
 def choose_operation() -> str:
-    print("\nChoose operation:")
-    print("  +   Addition")
-    print("  -   Subtraction")
-    print("  *   Multiplication")
-    print("  /   Division")
-    print("  ^   Power (a^b)")
-    print("  %   Modulus (a % b)")
-    print("  h   Show history")
-    print("  c   Clear history")
-    print("  q   Quit")
+    print(_MENU)
     return input("Operation: ").strip().lower()
 
 
@@ -110,7 +189,7 @@ def format_expression(a: float, op: str, b: float) -> str:
 # ----- Main program -----
 def main():
     print("=== Python CLI Calculator (with history) ===")
-    history = load_history()
+    log_fh = open_history_log()
 
     while True:
         op = choose_operation()
@@ -120,55 +199,45 @@ def main():
             break
 
         if op == "h":
+            log_fh.flush()  # make this session's entries visible on disk
+            history = tail_history()
             if not history:
                 print("No history yet.")
             else:
-                print("\n--- Calculation History (most recent last) ---")
+                # One buffered write for the whole listing instead of a
+                # print per entry.
+                lines = ["\n--- Calculation History (most recent last) ---"]
                 for i, entry in enumerate(history, start=1):
                     ts = entry.get("timestamp", "")
                     expr = entry.get("expression", "")
                     res = entry.get("result", "")
-                    print(f"{i}. [{ts}] {expr} = {res}")
+                    lines.append(f"{i}. [{ts}] {expr} = {res}")
+                sys.stdout.write("\n".join(lines) + "\n")
             continue
 
         if op == "c":
             confirm = input("Are you sure you want to clear history? (y/n): ").strip().lower()
             if confirm == "y":
-                history.clear()
-                save_history(history)
+                clear_history_log(log_fh)
                 print("History cleared.")
             else:
                 print("Clear history canceled.")
             continue
 
-        if op in {"+", "-", "*", "/", "^", "%"}:
+        if op in _OPS:
             a = get_number("Enter first number: ")
             b = get_number("Enter second number: ")
             expr = format_expression(a, op, b)
 
             try:
-                if op == "+":
-                    res = add(a, b)
-                elif op == "-":
-                    res = subtract(a, b)
-                elif op == "*":
-                    res = multiply(a, b)
-                elif op == "/":
-                    res = divide(a, b)
-                elif op == "^":
-                    res = power(a, b)
-                elif op == "%":
-                    res = modulus(a, b)
-                else:
-                    print("Unsupported operation.")
-                    continue
+                res = _OPS[op](a, b)
 
                 # Display nicely (strip trailing .0 for integer-results)
                 display_res = int(res) if isinstance(res, float) and res.is_integer() else res
                 print(f"Result: {expr} = {display_res}")
 
                 # Log to history
-                log_calculation(history, expr, display_res)
+                log_calculation(log_fh, expr, display_res)
 
             except ZeroDivisionError as zde:
                 print(f"Error: {zde}")
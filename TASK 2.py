@@ -1,14 +1,24 @@
 import random
 import logging
+import logging.handlers
 from datetime import datetime
 
+# One generator instance for the whole session; avoids going through the
+# module-level wrapper functions on every new game.
+_RNG = random.Random()
+
 # -----------------------------
 # Logging Configuration
 # -----------------------------
+# Buffer records in memory and flush in batches (every 100 records, on
+# ERROR, or at shutdown) instead of hitting the file per log call.
+_file_handler = logging.FileHandler("guess_game.log", delay=True)
+_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+)
 logging.basicConfig(
-    filename="guess_game.log",
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
+    handlers=[logging.handlers.MemoryHandler(capacity=100, target=_file_handler)],
 )
 
 
@@ -19,20 +29,24 @@ class NumberGuessingGame:
     def __init__(self, lower=1, upper=100):
         self.lower = lower
         self.upper = upper
-        self.secret_number = random.randint(lower, upper)
+        self.secret_number = _RNG.randrange(lower, upper + 1)
         self.attempts = 0
         logging.info("A new game has started with range %d to %d", lower, upper)
 
     def get_user_guess(self):
         """Safely get a guess from user"""
         while True:
-            try:
-                guess = int(input(f"Enter your guess ({self.lower}-{self.upper}): "))
+            s = input(f"Enter your guess ({self.lower}-{self.upper}): ").strip()
+            # Check the digits up front: valid input (the common case)
+            # never touches the exception machinery. isdecimal() matches
+            # int()'s grammar exactly; isdigit() also accepts characters
+            # like "²" that int() rejects.
+            if s.isdecimal() or (s[:1] in "+-" and s[1:].isdecimal()):
+                guess = int(s)
                 if self.lower <= guess <= self.upper:
                     return guess
-                else:
-                    print(f"⚠ Please enter a number between {self.lower} and {self.upper}.")
-            except ValueError:
+                print(f"⚠ Please enter a number between {self.lower} and {self.upper}.")
+            else:
                 print("⚠ Invalid input! Please enter a valid integer.")
 
     def check_guess(self, guess):
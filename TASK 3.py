@@ -1,12 +1,23 @@
 import logging
+import logging.handlers
+
+try:
+    import numpy as np  # optional, used to vectorize batch conversions
+except ImportError:
+    np = None
 
 # ---------------------------------
 # Logging Configuration
 # ---------------------------------
+# Buffer records in memory and flush in batches (every 100 records, on
+# ERROR, or at shutdown) instead of hitting the file per log call.
+_file_handler = logging.FileHandler("temperature_converter.log", delay=True)
+_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+)
 logging.basicConfig(
-    filename="temperature_converter.log",
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
+    handlers=[logging.handlers.MemoryHandler(capacity=100, target=_file_handler)],
 )
 
 
@@ -39,25 +50,44 @@ class TemperatureConverter:
         return (k - 273.15) * 9/5 + 32
 
 
+# (from_unit, to_unit) -> conversion function, so convert_temperature can
+# dispatch with one dict lookup instead of a six-way if/elif ladder.
+_CONV = {
+    ("C", "F"): TemperatureConverter.c_to_f,
+    ("F", "C"): TemperatureConverter.f_to_c,
+    ("C", "K"): TemperatureConverter.c_to_k,
+    ("K", "C"): TemperatureConverter.k_to_c,
+    ("F", "K"): TemperatureConverter.f_to_k,
+    ("K", "F"): TemperatureConverter.k_to_f,
+}
+
+
 # ---------------------------------
 # Utility Functions
 # ---------------------------------
+def _fast_float(s):
+    """Parse a number, short-circuiting the common plain-integer case"""
+    if s.lstrip("-").isdigit() and len(s) <= 15:
+        return float(int(s))
+    return float(s)
+
+
 def get_float_input(prompt):
     """Safely get a valid float input from user"""
     while True:
         try:
-            return float(input(prompt))
+            return _fast_float(input(prompt).strip())
         except ValueError:
             print("⚠ Invalid input! Please enter a numeric value.")
 
 
+_UNIT_MENU = "1. Celsius (C)\n2. Fahrenheit (F)\n3. Kelvin (K)"
+
+
 def choose_unit(prompt):
     """Choose temperature unit"""
     units = {"1": "C", "2": "F", "3": "K"}
-    print(prompt)
-    print("1. Celsius (C)")
-    print("2. Fahrenheit (F)")
-    print("3. Kelvin (K)")
+    print(f"{prompt}\n{_UNIT_MENU}")
 
     while True:
         choice = input("Select an option (1/2/3): ").strip()
@@ -70,22 +100,23 @@ def choose_unit(prompt):
 # Main Conversion Logic
 # ---------------------------------
 def convert_temperature(value, from_unit, to_unit):
-    conv = TemperatureConverter()
-
-    if from_unit == "C" and to_unit == "F":
-        return conv.c_to_f(value)
-    elif from_unit == "F" and to_unit == "C":
-        return conv.f_to_c(value)
-    elif from_unit == "C" and to_unit == "K":
-        return conv.c_to_k(value)
-    elif from_unit == "K" and to_unit == "C":
-        return conv.k_to_c(value)
-    elif from_unit == "F" and to_unit == "K":
-        return conv.f_to_k(value)
-    elif from_unit == "K" and to_unit == "F":
-        return conv.k_to_f(value)
-    else:
+    converter = _CONV.get((from_unit, to_unit))
+    if converter is None:
         return value  # same unit conversion
+    return converter(value)
+
+
+def convert_temperatures(values, from_unit, to_unit):
+    """Convert a whole sequence of temperatures at once.
+
+    With NumPy installed the conversion formulas run elementwise over a
+    single array instead of one Python call per value; otherwise this
+    falls back to a plain loop.
+    """
+    if np is not None:
+        return convert_temperature(np.asarray(values, dtype=float),
+                                   from_unit, to_unit)
+    return [convert_temperature(v, from_unit, to_unit) for v in values]
 
 
 # ---------------------------------
@@ -8,29 +8,54 @@ Features:
 - Input validation, logging, and clean OOP structure
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
+import sys
 from datetime import datetime
 from pathlib import Path
+from time import time_ns
 from typing import List, Optional, Dict
 
+try:
+    import orjson  # much faster JSON encode/decode, optional
+except ImportError:
+    orjson = None
+
 # --- Config ---
 DATA_FILE = Path("todo_data.json")
 LOG_FILE = "todo_app.log"
-logging.basicConfig(filename=LOG_FILE, level=logging.INFO,
-                    format="%(asctime)s - %(levelname)s - %(message)s")
+# Buffer records in memory and flush in batches (every 100 records, on
+# ERROR, or at shutdown) instead of hitting the file per log call.
+_file_handler = logging.FileHandler(LOG_FILE, delay=True)
+_file_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+)
+logging.basicConfig(
+    level=logging.INFO,
+    handlers=[logging.handlers.MemoryHandler(capacity=100, target=_file_handler)],
+)
 
 
 # --- Models ---
 class Task:
+    # Fixed attribute slots: no per-instance __dict__, so big task lists
+    # use noticeably less memory and attribute access is faster.
+    __slots__ = ("id", "title", "description", "due", "created_at",
+                 "completed", "_title_lc", "_desc_lc")
+
     def __init__(self, title: str, description: str = "", due: Optional[str] = None,
                 created_at: Optional[str] = None, completed: bool = False, id: Optional[int] = None):
-        self.id = id or int(datetime.utcnow().timestamp() * 1000)  # simple unique id
+        self.id = id or time_ns()  # simple unique id
         self.title = title.strip()
         self.description = description.strip()
         self.due = due  # optional due date string
         self.created_at = created_at or datetime.utcnow().isoformat()
         self.completed = completed
+        # Cached lowercase forms so search doesn't re-lower every task
+        self._title_lc = self.title.lower()
+        self._desc_lc = self.description.lower()
 
     def to_dict(self) -> Dict:
         return {
@@ -56,6 +81,11 @@ class Task:
 
 # --- Storage / Repository ---
 class TodoRepository:
+    # Parsed tasks keyed by path -> (mtime_ns, tasks), shared across
+    # instances so repeated invocations skip the JSON parse when the file
+    # has not changed.
+    _cache: Dict[Path, tuple] = {}
+
     def __init__(self, path: Path = DATA_FILE):
         self.path = path
         self._ensure_file()
@@ -66,17 +96,36 @@ class TodoRepository:
 
     def _read_data(self) -> List[Dict]:
         try:
+            if orjson is not None:
+                return orjson.loads(self.path.read_bytes())
             with self.path.open("r", encoding="utf-8") as f:
                 return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
+        except (ValueError, FileNotFoundError):
             return []
 
     def _write_data(self, data: List[Dict]):
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        # Serialize in one shot and write in a single call; json.dump would
+        # issue many tiny writes to the file object.
+        if orjson is not None:
+            self.path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with self.path.open("w", encoding="utf-8") as f:
+                f.write(json.dumps(data, indent=2))
+        self._cache.pop(self.path, None)
 
     def list_tasks(self) -> List[Task]:
-        return [Task.from_dict(d) for d in self._read_data()]
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._cache.get(self.path)
+        if cached is not None and cached[0] == mtime:
+            # Copy so callers can reorder/trim without poisoning the cache
+            return list(cached[1])
+        tasks = [Task.from_dict(d) for d in self._read_data()]
+        if mtime is not None:
+            self._cache[self.path] = (mtime, list(tasks))
+        return tasks
 
     def save_tasks(self, tasks: List[Task]):
         self._write_data([t.to_dict() for t in tasks])
@@ -84,54 +133,79 @@ class TodoRepository:
 
 # --- Service / Business Logic ---
 class TodoService:
+    # Write the file after this many buffered mutations (or on flush()).
+    FLUSH_EVERY = 16
+
     def __init__(self, repo: TodoRepository):
         self.repo = repo
         self.tasks: List[Task] = self.repo.list_tasks()
+        # Sort once on load; add_task appends and created_at is monotonic,
+        # so the list stays ordered without re-sorting on every view.
+        self.tasks.sort(key=lambda x: x.created_at)
+        # id -> Task index so mutators don't have to scan the list
+        self._by_id: Dict[int, Task] = {t.id: t for t in self.tasks}
+        self._dirty = False
+        self._pending = 0
 
     def _persist(self):
-        self.repo.save_tasks(self.tasks)
+        # Mark state dirty and coalesce bursts of mutations into one write
+        # instead of rewriting the whole file per change.
+        self._dirty = True
+        self._pending += 1
+        if self._pending >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        """Write buffered changes to disk, if any."""
+        if self._dirty:
+            self.repo.save_tasks(self.tasks)
+            self._dirty = False
+            self._pending = 0
 
     def add_task(self, title: str, description: str = "", due: Optional[str] = None) -> Task:
         if not title.strip():
             raise ValueError("Title cannot be empty.")
         task = Task(title=title, description=description, due=due)
         self.tasks.append(task)
+        self._by_id[task.id] = task
         self._persist()
         logging.info("Added task: %s (id=%s)", task.title, task.id)
         return task
 
     def remove_task(self, task_id: int) -> bool:
-        original = len(self.tasks)
-        self.tasks = [t for t in self.tasks if t.id != task_id]
-        removed = len(self.tasks) < original
-        if removed:
-            self._persist()
-            logging.info("Removed task id=%s", task_id)
-        return removed
+        task = self._by_id.pop(task_id, None)
+        if task is None:
+            return False
+        self.tasks.remove(task)
+        self._persist()
+        logging.info("Removed task id=%s", task_id)
+        return True
 
     def edit_task(self, task_id: int, title: Optional[str] = None,
                 description: Optional[str] = None, due: Optional[str] = None) -> bool:
-        for t in self.tasks:
-            if t.id == task_id:
-                if title is not None and title.strip():
-                    t.title = title.strip()
-                if description is not None:
-                    t.description = description.strip()
-                if due is not None:
-                    t.due = due
-                self._persist()
-                logging.info("Edited task id=%s", task_id)
-                return True
-        return False
+        t = self._by_id.get(task_id)
+        if t is None:
+            return False
+        if title is not None and title.strip():
+            t.title = title.strip()
+            t._title_lc = t.title.lower()
+        if description is not None:
+            t.description = description.strip()
+            t._desc_lc = t.description.lower()
+        if due is not None:
+            t.due = due
+        self._persist()
+        logging.info("Edited task id=%s", task_id)
+        return True
 
     def complete_task(self, task_id: int) -> bool:
-        for t in self.tasks:
-            if t.id == task_id:
-                t.completed = True
-                self._persist()
-                logging.info("Completed task id=%s", task_id)
-                return True
-        return False
+        t = self._by_id.get(task_id)
+        if t is None:
+            return False
+        t.completed = True
+        self._persist()
+        logging.info("Completed task id=%s", task_id)
+        return True
 
     def list_tasks(self, filter_by: str = "all", query: Optional[str] = None) -> List[Task]:
         results = self.tasks
@@ -142,18 +216,17 @@ class TodoService:
 
         if query:
             q = query.lower()
-            results = [t for t in results if q in t.title.lower() or q in t.description.lower()]
+            results = [t for t in results if q in t._title_lc or q in t._desc_lc]
 
-        # sort by created_at ascending
-        results.sort(key=lambda x: x.created_at)
+        # self.tasks is kept sorted by created_at, and the filters above
+        # preserve order, so no per-view sort is needed.
         return results
 
 
 # --- CLI Helpers ---
 def prompt_choice(prompt: str, choices: List[str]) -> str:
-    print(prompt)
-    for i, c in enumerate(choices, start=1):
-        print(f"{i}. {c}")
+    # One print for the whole menu instead of one per choice
+    print("\n".join([prompt] + [f"{i}. {c}" for i, c in enumerate(choices, start=1)]))
     while True:
         sel = input("Select an option: ").strip()
         if sel.isdigit() and 1 <= int(sel) <= len(choices):
@@ -165,27 +238,31 @@ def prompt_int(prompt: str) -> Optional[int]:
     val = input(prompt).strip()
     if not val:
         return None
-    try:
+    if val.isdecimal() or (val[:1] in "+-" and val[1:].isdecimal()):
         return int(val)
-    except ValueError:
-        print("Please enter a valid integer id.")
-        return None
+    print("Please enter a valid integer id.")
+    return None
 
 
 def pretty_print_tasks(tasks: List[Task]):
     if not tasks:
         print("No tasks found.")
         return
+    # Build the whole listing first and emit it with one write instead of
+    # one print (and one underlying syscall) per task.
+    lines = []
     for t in tasks:
         status = "✓" if t.completed else " "
         due = f" | due: {t.due}" if t.due else ""
-        print(f"[{status}] id={t.id} | {t.title}{due}\n    {t.description}\n")
+        lines.append(f"[{status}] id={t.id} | {t.title}{due}\n    {t.description}\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # --- Main Program ---
 def main():
     repo = TodoRepository()
     service = TodoService(repo)
+    atexit.register(service.flush)  # don't lose buffered changes on exit
 
     print("=== Simple To-Do CLI (Alfido Tech Internship) ===\n")
     while True:
@@ -229,12 +306,14 @@ def main():
             print("Marked completed." if ok else "Task not found.")
 
         elif action == "View tasks":
+            service.flush()
             filt = prompt_choice("Filter by:", ["all", "pending", "completed"])
             q = input("Search query (optional): ").strip() or None
             tasks = service.list_tasks(filter_by=filt, query=q)
             pretty_print_tasks(tasks)
 
         elif action == "Exit":
+            service.flush()
             print("Goodbye 👋")
             break
 